@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Coroutine
+import hashlib
 import re
+import time
+from typing import Any, Final
 
+from aiohttp import ClientError
 from intellifire4py import UnifiedFireplace
 from intellifire4py.cloud_interface import IntelliFireCloudInterface
 from intellifire4py.const import IntelliFireApiMode
@@ -19,6 +24,8 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_AUTH_COOKIE,
@@ -30,9 +37,13 @@ from .const import (
     DOMAIN,
     LOGGER,
 )
-from .coordinator import IntellifireDataUpdateCoordinator
+from .coordinator import (
+    IntellifireConfigEntry,
+    IntellifireDataUpdateCoordinator,
+    IntellifireEntryContext,
+)
 
-PLATFORMS = [
+PLATFORMS: Final = (
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
     Platform.FAN,
@@ -40,160 +51,337 @@ PLATFORMS = [
     Platform.NUMBER,
     Platform.SENSOR,
     Platform.SWITCH,
-]
+)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Cloud serial numbers are 32 character hex strings
+_SERIAL_RE = re.compile(r"^[0-9A-Fa-f]{32}$")
+
+# Cloud logins are shared between fireplaces on the same account
+_CLOUD_CACHE = f"{DOMAIN}_cloud_cache"
+_CLOUD_CACHE_TTL = 3600  # seconds
+# Account fireplaces not yet handed out and their expiry, keyed on a credential hash
+_CloudCache = dict[bytes, tuple[list[IntelliFireCommonFireplaceData], float]]
+
+# Matches the timeout of the library's own connectivity checks
+_PROBE_TIMEOUT = 30  # seconds
+
+# Pause between polls while waiting for a fireplace to initialize
+_INIT_RETRY_DELAY = 5  # seconds
 
 
 def _construct_common_data(entry: ConfigEntry) -> IntelliFireCommonFireplaceData:
     """Convert a config entry into IntelliFireCommonFireplaceData."""
 
+    data, options = entry.data, entry.options
     return IntelliFireCommonFireplaceData(
-        auth_cookie=entry.data[CONF_AUTH_COOKIE],
-        user_id=entry.data[CONF_USER_ID],
-        web_client_id=entry.data[CONF_WEB_CLIENT_ID],
-        serial=entry.data[CONF_SERIAL],
-        api_key=entry.data[CONF_API_KEY],
-        ip_address=entry.data[CONF_IP_ADDRESS],
-        read_mode=entry.options[CONF_READ_MODE],
-        control_mode=entry.options[CONF_CONTROL_MODE],
+        auth_cookie=data[CONF_AUTH_COOKIE],
+        user_id=data[CONF_USER_ID],
+        web_client_id=data[CONF_WEB_CLIENT_ID],
+        serial=data[CONF_SERIAL],
+        api_key=data[CONF_API_KEY],
+        ip_address=data[CONF_IP_ADDRESS],
+        read_mode=options[CONF_READ_MODE],
+        control_mode=options[CONF_CONTROL_MODE],
     )
 
 
+async def _async_find_cloud_fireplace(
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    serial: str | None,
+    ip_address: str,
+) -> IntelliFireCommonFireplaceData | None:
+    """Find a fireplace on a cloud account, reusing a recent login for the account.
+
+    Only the account's fireplace data is kept, never the credentials, and each
+    fireplace is dropped once it has been handed out.
+    """
+    cache: _CloudCache = hass.data[_CLOUD_CACHE]
+    now = time.monotonic()
+    for expired in [key for key, (_, expires) in cache.items() if expires <= now]:
+        del cache[expired]
+
+    key = hashlib.sha256(f"{username}:{password}".encode()).digest()
+    if cached := cache.get(key):
+        LOGGER.debug("Reusing cached cloud login")
+        fireplaces = cached[0]
+    else:
+        async with IntelliFireCloudInterface() as cloud_interface:
+            await cloud_interface.login_with_credentials(
+                username=username, password=password
+            )
+        fireplaces = list(cloud_interface.user_data.fireplaces)
+        cache[key] = (fireplaces, now + _CLOUD_CACHE_TTL)
+
+    # See if we can find the fireplace first by serial and then secondly by IP.
+    fireplace = next((fp for fp in fireplaces if serial and fp.serial == serial), None)
+    if fireplace is None:
+        fireplace = next((fp for fp in fireplaces if fp.ip_address == ip_address), None)
+    if fireplace is None:
+        return None
+
+    fireplaces.remove(fireplace)
+    if not fireplaces:
+        del cache[key]
+    return fireplace
+
+
 async def _async_pseudo_migrate_entry(
     hass: HomeAssistant, config_entry: ConfigEntry
-) -> ConfigEntry:
-    """Update configuration entry to latest VERSION 1 format.."""
+) -> tuple[ConfigEntry, IntelliFireCommonFireplaceData]:
+    """Update configuration entry to latest VERSION 1 format.
+
+    Also returns the fireplace data found in the cloud, so setup does not need to
+    rebuild it from the freshly updated entry.
+    """
     new = {**config_entry.data}
     # Rename Host to IP Address
     new[CONF_IP_ADDRESS] = new.pop("host")
 
-    username = config_entry.data[CONF_USERNAME]
-    password = config_entry.data[CONF_PASSWORD]
+    serial = config_entry.title.replace("Fireplace ", "")
 
-    # Create a Cloud Interface
-    async with IntelliFireCloudInterface() as cloud_interface:
-        await cloud_interface.login_with_credentials(
-            username=username, password=password
-        )
+    # If serial matches the hex style pattern we'll assume its good
+    valid_serial = bool(_SERIAL_RE.match(serial))
 
-        # See if we can find the fireplace first by serial and then secondly by IP.
+    new_data = await _async_find_cloud_fireplace(
+        hass,
+        new[CONF_USERNAME],
+        new[CONF_PASSWORD],
+        serial if valid_serial else None,
+        new[CONF_IP_ADDRESS],
+    )
+    if not new_data:
+        raise ConfigEntryAuthFailed
 
-        serial = config_entry.title.replace("Fireplace ", "")
+    # Find the correct fireplace
+    new[CONF_API_KEY] = new_data.api_key
+    new[CONF_WEB_CLIENT_ID] = new_data.web_client_id
+    new[CONF_AUTH_COOKIE] = new_data.auth_cookie
+
+    new[CONF_IP_ADDRESS] = new_data.ip_address
+    new[CONF_SERIAL] = new_data.serial
+
+    config_entry.version = 1
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data=new,
+        options={CONF_READ_MODE: "local", CONF_CONTROL_MODE: "local"},
+        unique_id=serial,
+    )
+    LOGGER.debug("Pseudo Migration %s successful", config_entry.version)
+
+    # Set to local, matching the options written above
+    common_data = IntelliFireCommonFireplaceData(
+        auth_cookie=new_data.auth_cookie,
+        user_id=new_data.user_id,
+        web_client_id=new_data.web_client_id,
+        serial=new_data.serial,
+        api_key=new_data.api_key,
+        ip_address=new_data.ip_address,
+        read_mode=IntelliFireApiMode.LOCAL,
+        control_mode=IntelliFireApiMode.LOCAL,
+    )
 
-        # If serial matches the hex style pattern we'll assume its good
-        valid_serial = bool(re.match(r"^[0-9A-Fa-f]{32}$", serial))
+    return config_entry, common_data
 
-        new_data = (
-            cloud_interface.user_data.get_data_for_serial(serial)
-            if valid_serial
-            else None
-        )
-        if not new_data:
-            new_data = cloud_interface.user_data.get_data_for_ip(new[CONF_IP_ADDRESS])
 
-    if not new_data:
-        raise ConfigEntryAuthFailed
+async def _async_build_fireplace(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    common_data: IntelliFireCommonFireplaceData,
+) -> UnifiedFireplace:
+    """Build the fireplace, only gating setup on the interfaces it will use.
 
-    # Find the correct fireplace
-    if new_data is not None:
-        new[CONF_API_KEY] = new_data.api_key
-        new[CONF_WEB_CLIENT_ID] = new_data.web_client_id
-        new[CONF_AUTH_COOKIE] = new_data.auth_cookie
-
-        new[CONF_IP_ADDRESS] = new_data.ip_address
-        new[CONF_SERIAL] = new_data.serial
-
-        config_entry.version = 1
-        hass.config_entries.async_update_entry(
-            config_entry,
-            data=new,
-            options={CONF_READ_MODE: "local", CONF_CONTROL_MODE: "local"},
-            unique_id=serial,
+    The library's builder waits on both the local and the cloud probe. When
+    everything is configured to run locally the cloud result is informational,
+    so probe it in the background instead of letting the cloud hold up setup.
+    """
+    if (
+        common_data.read_mode != IntelliFireApiMode.LOCAL
+        or common_data.control_mode != IntelliFireApiMode.LOCAL
+    ):
+        return await UnifiedFireplace.build_fireplace_from_common(common_data)
+
+    fireplace = UnifiedFireplace(
+        common_data,
+        read_mode=IntelliFireApiMode.NONE,
+        control_mode=IntelliFireApiMode.NONE,
+    )
+
+    # Switching the read mode copies the other API's data over the one switched
+    # to, so switch before probing to keep the probed data for setup
+    await fireplace.set_read_mode(IntelliFireApiMode.LOCAL)
+    await fireplace.set_control_mode(IntelliFireApiMode.LOCAL)
+    # Hold back the poller's first request so the probe is the only one
+    await fireplace.read_api.stop_background_polling()
+
+    if not await _async_probe(fireplace.perform_local_poll()):
+        # Same fallback as the library's builder, without probing local again
+        fireplace.local_connectivity = False
+        fireplace.cloud_connectivity = await _async_probe(
+            fireplace.perform_cloud_poll()
         )
-        LOGGER.debug("Pseudo Migration %s successful", config_entry.version)
+        if not fireplace.cloud_connectivity:
+            raise ConfigEntryNotReady(
+                "No connectivity to fireplace via either Local or Cloud"
+            )
+        LOGGER.debug("Local poll failed, falling back to the cloud")
+        # Switching copies the unpolled local data over the probed cloud data,
+        # it is only filled in again by the poll the cloud poller makes on start
+        await fireplace.set_read_mode(IntelliFireApiMode.CLOUD)
+        await fireplace.set_control_mode(IntelliFireApiMode.CLOUD)
+        return fireplace
+
+    fireplace.local_connectivity = True
+    await fireplace.read_api.start_background_polling()
+
+    async def _async_probe_cloud() -> None:
+        """Record whether the cloud interface is reachable."""
+        fireplace.cloud_connectivity = await _async_probe(
+            fireplace.perform_cloud_poll()
+        )
+
+    entry.async_create_background_task(
+        hass, _async_probe_cloud(), f"{DOMAIN} cloud connectivity {entry.entry_id}"
+    )
+
+    return fireplace
 
-    return config_entry
+
+async def _async_probe(poll: Coroutine[Any, Any, None]) -> bool:
+    """Return whether a connectivity poll succeeded within the library's timeout."""
+    try:
+        await asyncio.wait_for(poll, timeout=_PROBE_TIMEOUT)
+    except Exception as err:  # pylint: disable=broad-except
+        # Like the library's own probe, any failure just means no connectivity
+        LOGGER.debug("Connectivity check failed: %s", err)
+        return False
+    return True
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the IntelliFire integration."""
+    hass.data[_CLOUD_CACHE] = {}
+    return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: IntellifireConfigEntry) -> bool:
     """Set up IntelliFire from a config entry."""
     LOGGER.debug("Setting up config entry: %s", entry.unique_id)
 
-    if CONF_USERNAME not in entry.data:
+    data = entry.data
+    if CONF_USERNAME not in data:
         LOGGER.debug("Super Old config entry format detected: %s", entry.unique_id)
         raise ConfigEntryAuthFailed
 
-    if CONF_IP_ADDRESS not in entry.data:
+    if CONF_IP_ADDRESS not in data:
         LOGGER.debug("Old config entry format detected: %s", entry.unique_id)
-        entry = await _async_pseudo_migrate_entry(hass, entry)
+        entry, common_data = await _async_pseudo_migrate_entry(hass, entry)
+    else:
+        common_data = _construct_common_data(entry)
 
     # Fireplace will throw an error if it can't connect
     try:
-        fireplace: UnifiedFireplace = (
-            await UnifiedFireplace.build_fireplace_from_common(
-                _construct_common_data(entry)
+        fireplace = await _async_build_fireplace(hass, entry, common_data)
+        if not _fireplace_initialized(fireplace):
+            LOGGER.debug("Waiting for Fireplace to Initialized")
+            await asyncio.wait_for(
+                _async_wait_for_initialization(fireplace), timeout=600
             )
-        )
-        LOGGER.info("Waiting for Fireplace to Initialized")
-        await asyncio.wait_for(_async_wait_for_initialization(fireplace), timeout=600)
     except asyncio.TimeoutError as err:
         raise ConfigEntryNotReady(
             "Initialization of fireplace timed out after 10 minutes"
         ) from err
+    except ClientError as err:
+        # The library's builder raises this when neither interface answers
+        raise ConfigEntryNotReady(f"Unable to connect to fireplace: {err}") from err
 
-    LOGGER.warn("Creating Data Update Coordinator")
+    LOGGER.debug("Creating Data Update Coordinator")
     # Construct coordinator
 
 
 
     data_update_coordinator = IntellifireDataUpdateCoordinator(
-        hass=hass, fireplace=fireplace
+        hass=hass,
+        fireplace=fireplace,
+        ctx=IntellifireEntryContext(
+            serial=common_data.serial, ip_address=common_data.ip_address
+        ),
     )
 
-    LOGGER.info("Await first refresh")
+    LOGGER.debug("Await first refresh")
     await data_update_coordinator.async_config_entry_first_refresh()
-    LOGGER.info("Register Listener")
+    LOGGER.debug("Register Listener")
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = data_update_coordinator
+    entry.runtime_data = data_update_coordinator
 
-    LOGGER.warn("async_forward_entry_setups")
+    LOGGER.debug("async_forward_entry_setups")
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
-async def _async_wait_for_initialization(fireplace, timeout=600):
-    """Wait for a fireplace to be initialized."""
-    while (
-        fireplace.data.ipv4_address == "127.0.0.1" and fireplace.data.serial == "unset"
-    ):
-        LOGGER.info(f"Waiting for fireplace to initialize [{fireplace.read_mode}]")
-        await asyncio.sleep(10)
-
-
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+def _fireplace_initialized(fireplace: UnifiedFireplace) -> bool:
+    """Return whether the fireplace holds real poll data rather than the defaults."""
+    data = fireplace.data
+    return data.ipv4_address != "127.0.0.1" or data.serial != "unset"
+
+
+async def _async_wait_for_initialization(fireplace: UnifiedFireplace) -> None:
+    """Wait for a fireplace to be initialized.
+
+    Rather than sleeping until the background poller fills in the data, poll the
+    active read API directly so we return as soon as the fireplace answers.
+    """
+    while not _fireplace_initialized(fireplace):
+        LOGGER.info("Waiting for fireplace to initialize [%s]", fireplace.read_mode)
+        try:
+            if fireplace.read_mode == IntelliFireApiMode.LOCAL:
+                await fireplace.perform_local_poll()
+            else:
+                await fireplace.perform_cloud_poll()
+        except Exception as err:  # pylint: disable=broad-except
+            # A half booted module can answer with anything, keep waiting
+            LOGGER.debug("Fireplace not ready yet: %s", err)
+        else:
+            if _fireplace_initialized(fireplace):
+                return
+        await asyncio.sleep(_INIT_RETRY_DELAY)
+
+
+async def async_unload_entry(
+    hass: HomeAssistant, entry: IntellifireConfigEntry
+) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        await entry.runtime_data.async_shutdown()
 
     return unload_ok
 
 
-async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def update_listener(hass: HomeAssistant, entry: IntellifireConfigEntry) -> None:
     """Handle options update."""
-    LOGGER.error("Handling Options Update")
-    data_update_coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][
-        entry.entry_id
-    ]
-    LOGGER.error(
-        f"Current Modes: Read [{data_update_coordinator.get_read_mode()}] Control [{data_update_coordinator.get_control_mode()}]"
+    LOGGER.debug("Handling Options Update")
+    data_update_coordinator = entry.runtime_data
+    LOGGER.debug(
+        "Current Modes: Read [%s] Control [%s]",
+        data_update_coordinator.get_read_mode(),
+        data_update_coordinator.get_control_mode(),
     )
 
-    await data_update_coordinator.set_read_mode(
-        IntelliFireApiMode(entry.options[CONF_READ_MODE])
-    )
-    await data_update_coordinator.set_control_mode(
-        IntelliFireApiMode(entry.options[CONF_CONTROL_MODE])
+    # Read and control modes are independent of each other, switch them together
+    options = entry.options
+    await asyncio.gather(
+        data_update_coordinator.set_read_mode(
+            IntelliFireApiMode(options[CONF_READ_MODE])
+        ),
+        data_update_coordinator.set_control_mode(
+            IntelliFireApiMode(options[CONF_CONTROL_MODE])
+        ),
     )
 
     await hass.config_entries.async_reload(entry.entry_id)
@@ -11,17 +11,15 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import IntellifireDataUpdateCoordinator
-from .const import DOMAIN
+from .coordinator import IntellifireConfigEntry, IntellifireDataUpdateCoordinator
 from .entity import IntellifireEntity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntellifireBinarySensorRequiredKeysMixin:
     """Mixin for required keys."""
 
@@ -161,15 +159,17 @@ INTELLIFIRE_BINARY_SENSORS: tuple[IntellifireBinarySensorEntityDescription, ...]
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IntellifireConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up a IntelliFire On/Off Sensor."""
-    coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     async_add_entities(
-        IntellifireBinarySensor(coordinator=coordinator, description=description)
-        for description in INTELLIFIRE_BINARY_SENSORS
+        [
+            IntellifireBinarySensor(coordinator=coordinator, description=description)
+            for description in INTELLIFIRE_BINARY_SENSORS
+        ]
     )
 
 
@@ -178,7 +178,17 @@ class IntellifireBinarySensor(IntellifireEntity, BinarySensorEntity):
 
     entity_description: IntellifireBinarySensorEntityDescription
 
+    def __init__(
+        self,
+        coordinator: IntellifireDataUpdateCoordinator,
+        description: IntellifireBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, description)
+
+        self._value_fn = description.value_fn
+
     @property
     def is_on(self) -> bool:
         """Use this to get the correct value."""
-        return self.entity_description.value_fn(self.coordinator.read_api.data)
+        return self._value_fn(self._data)
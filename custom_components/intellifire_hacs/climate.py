@@ -9,13 +9,12 @@ from homeassistant.components.climate import (
     ClimateEntityFeature,
     HVACMode,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import IntellifireDataUpdateCoordinator
-from .const import DEFAULT_THERMOSTAT_TEMP, DOMAIN, LOGGER
+from .const import DEFAULT_THERMOSTAT_TEMP, LOGGER
+from .coordinator import IntellifireConfigEntry, IntellifireDataUpdateCoordinator
 from .entity import IntellifireEntity
 
 INTELLIFIRE_CLIMATES: tuple[ClimateEntityDescription, ...] = (
@@ -25,19 +24,21 @@ INTELLIFIRE_CLIMATES: tuple[ClimateEntityDescription, ...] = (
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IntellifireConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Configure the fan entry.."""
-    coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     if coordinator.data.has_thermostat:
         async_add_entities(
-            IntellifireClimate(
-                coordinator=coordinator,
-                description=description,
-            )
-            for description in INTELLIFIRE_CLIMATES
+            [
+                IntellifireClimate(
+                    coordinator=coordinator,
+                    description=description,
+                )
+                for description in INTELLIFIRE_CLIMATES
+            ]
         )
 
 
@@ -69,7 +70,7 @@ class IntellifireClimate(IntellifireEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current hvac mode."""
-        if self.coordinator.read_api.data.thermostat_on:
+        if self._data.thermostat_on:
             return HVACMode.HEAT
         return HVACMode.OFF
 
@@ -89,12 +90,12 @@ class IntellifireClimate(IntellifireEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float:
         """Return the current temperature."""
-        return float(self.coordinator.read_api.data.temperature_c)
+        return float(self._data.temperature_c)
 
     @property
     def target_temperature(self) -> float:
         """Return target temperature."""
-        return float(self.coordinator.read_api.data.thermostat_setpoint_c)
+        return float(self._data.thermostat_setpoint_c)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode to normal or thermostat control."""
@@ -113,7 +114,7 @@ class IntellifireClimate(IntellifireEntity, ClimateEntity):
         )
 
         # 2) Make sure the fireplace is on!
-        if not self.coordinator.read_api.data.is_on:
+        if not self.coordinator.read_data.is_on:
             await self.coordinator.control_api.flame_on()
 
     async def async_turn_off(self) -> None:
@@ -1,7 +1,9 @@
 """The IntelliFire integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
 from intellifire4py import UnifiedFireplace
 from intellifire4py.const import IntelliFireApiMode
@@ -9,12 +11,35 @@ from intellifire4py.control import IntelliFireController
 from intellifire4py.model import IntelliFirePollData
 from intellifire4py.read import IntelliFireDataProvider
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util.dt import utcnow
 
 from .const import DOMAIN, LOGGER
 
+UPDATE_INTERVAL = timedelta(seconds=15)
+MAX_UPDATE_INTERVAL = timedelta(minutes=10)
+
+# The cloud read API long-polls, which only records a poll once the server answers
+# after up to 61 seconds, so it is given several of those windows before it counts
+# as stale
+CLOUD_STALE_AFTER = timedelta(minutes=3)
+CLOUD_RESTART_TIMEOUT = 30  # seconds
+
+# Window in which refresh requests after commands are folded into one poll
+REQUEST_REFRESH_COOLDOWN = 0.3  # seconds
+
+
+@dataclass(frozen=True, slots=True)
+class IntellifireEntryContext:
+    """Config entry values the integration needs after setup."""
+
+    serial: str
+    ip_address: str
+
 
 class IntellifireDataUpdateCoordinator(DataUpdateCoordinator[IntelliFirePollData]):
     """Class to manage the polling of the fireplace API."""
@@ -23,26 +48,48 @@ class IntellifireDataUpdateCoordinator(DataUpdateCoordinator[IntelliFirePollData
         self,
         hass: HomeAssistant,
         fireplace: UnifiedFireplace,
+        ctx: IntellifireEntryContext,
     ) -> None:
         """Initialize the Coordinator."""
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=15),
+            update_interval=UPDATE_INTERVAL,
+            # Commands sent in quick succession (flame and pilot, fan and light)
+            # each request a refresh, let them share a single one
+            request_refresh_debouncer=Debouncer(
+                hass, LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
         self.fireplace = fireplace
+        self.ctx = ctx
+        self._stale_refreshes = 0
+
+        # Marks each refresh, so values derived from the poll data can be reused
+        self.refresh_time: datetime = utcnow()
+
+        # Resolved once here and again on mode changes rather than on every access
+        self._read_api: IntelliFireDataProvider = fireplace.read_api
+        self._control_api: IntelliFireController = fireplace.control_api
+
+        self._device_info: DeviceInfo | None = None
 
     @property
     def read_api(self) -> IntelliFireDataProvider:
         """Return the Status API pointer."""
-        return self.fireplace.read_api
+        return self._read_api
 
     @property
     def control_api(self) -> IntelliFireController:
         """Return the control API."""
-        return self.fireplace.control_api
+        return self._control_api
+
+    @property
+    def read_data(self) -> IntelliFirePollData:
+        """Return the latest poll data from the read API."""
+        return self._read_api.data
 
     def get_read_mode(self) -> IntelliFireApiMode:
         """Return _read_mode as a property."""
@@ -50,7 +97,10 @@ class IntellifireDataUpdateCoordinator(DataUpdateCoordinator[IntelliFirePollData
 
     async def set_read_mode(self, mode: IntelliFireApiMode):
         """Set the read mode between Cloud/Local."""
+        if mode == self.fireplace.read_mode:
+            return
         await self.fireplace.set_read_mode(mode)
+        self._read_api = self.fireplace.read_api
 
     def get_control_mode(self) -> IntelliFireApiMode:
         """Read control mode as a property."""
@@ -58,21 +108,93 @@ class IntellifireDataUpdateCoordinator(DataUpdateCoordinator[IntelliFirePollData
 
     async def set_control_mode(self, mode: IntelliFireApiMode):
         """Set the control mode between Cloud/Local."""
+        if mode == self.fireplace.control_mode:
+            return
         await self.fireplace.set_control_mode(mode)
+        self._control_api = self.fireplace.control_api
 
     async def _async_update_data(self) -> IntelliFirePollData:
-        return self.fireplace.data
+        self.refresh_time = now = utcnow()
+
+        last_poll = self._read_api.last_poll_utc
+        if last_poll is None or now - last_poll > self._stale_after():
+            await self._async_back_off()
+        elif self._stale_refreshes:
+            LOGGER.info("Fireplace is responding again, resuming normal polling")
+            self._stale_refreshes = 0
+            self.update_interval = UPDATE_INTERVAL
+            # The cloud long-poller is running fine, restarting it would only
+            # cancel the request in flight
+            if self.fireplace.read_mode == IntelliFireApiMode.LOCAL:
+                await self._async_restart_local_polling()
+
+        return self._read_api.data
+
+    def _stale_after(self) -> timedelta:
+        """Return how old the last poll may get before the data counts as stale."""
+        if self.fireplace.read_mode == IntelliFireApiMode.CLOUD:
+            return CLOUD_STALE_AFTER
+        return 2 * self.update_interval
+
+    async def _async_back_off(self) -> None:
+        """Slow down polling while the fireplace is not answering."""
+        self._stale_refreshes += 1
+        self.update_interval = min(
+            UPDATE_INTERVAL * 2**self._stale_refreshes, MAX_UPDATE_INTERVAL
+        )
+        LOGGER.debug(
+            "No fresh fireplace data [x%d], polling every %s",
+            self._stale_refreshes,
+            self.update_interval,
+        )
+        if self.fireplace.read_mode == IntelliFireApiMode.LOCAL:
+            await self._async_restart_local_polling(
+                int(self.update_interval.total_seconds())
+            )
+        else:
+            await self._async_restart_cloud_polling()
+
+    async def _async_restart_local_polling(self, *args: int) -> None:
+        """Restart the local background poller, optionally with a new wait time."""
+        # This also revives a poller whose task died on a connection error
+        await self._read_api.stop_background_polling()
+        await self._read_api.start_background_polling(*args)
+
+    async def _async_restart_cloud_polling(self) -> None:
+        """Restart the cloud long-poller after its connection went quiet."""
+        await self._read_api.stop_background_polling()
+        try:
+            # Starting the cloud poller performs a poll inline before returning
+            await asyncio.wait_for(
+                self._read_api.start_background_polling(),
+                timeout=CLOUD_RESTART_TIMEOUT,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # Matches the poller itself, which carries on past any poll error
+            LOGGER.debug("Unable to restart cloud polling: %s", err)
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh and stop the fireplace background polling."""
+        await super().async_shutdown()
+        # Switching to NONE stops both the local and cloud background pollers
+        await self.fireplace.set_read_mode(IntelliFireApiMode.NONE)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
 
-        data = self.fireplace._fireplace_data
+        # Built from the config entry data, which is fixed for our lifetime
+        if self._device_info is None:
+            ctx = self.ctx
+            self._device_info = DeviceInfo(
+                manufacturer="Hearth and Home",
+                model="IFT-WFM",
+                name="IntelliFire",
+                identifiers={("IntelliFire", f"{ctx.serial}]")},
+                configuration_url=f"http://{ctx.ip_address}/poll",
+            )
 
-        return DeviceInfo(
-            manufacturer="Hearth and Home",
-            model="IFT-WFM",
-            name="IntelliFire",
-            identifiers={("IntelliFire", f"{data.serial}]")},
-            configuration_url=f"http://{data.ip_address}/poll",
-        )
+        return self._device_info
+
+
+IntellifireConfigEntry = ConfigEntry[IntellifireDataUpdateCoordinator]
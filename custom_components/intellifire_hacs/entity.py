@@ -1,6 +1,9 @@
 """Platform for shared base classes for sensors."""
 from __future__ import annotations
 
+from intellifire4py.model import IntelliFirePollData
+
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -22,11 +25,22 @@ class IntellifireEntity(CoordinatorEntity[IntellifireDataUpdateCoordinator]):
         """Class initializer."""
         super().__init__(coordinator=coordinator)
 
-        LOGGER.info("Setting up Entity %s", description.name)
-        LOGGER.info("Setting up Entity %s_%s", description.key, coordinator.fireplace.serial)
+        LOGGER.debug("Setting up Entity %s", description.name)
+        LOGGER.debug(
+            "Setting up Entity %s_%s", description.key, coordinator.ctx.serial
+        )
 
         self.entity_description = description
-        self._attr_unique_id = f"{description.key}_{coordinator.fireplace.serial}"
+        self._attr_unique_id = f"{description.key}_{coordinator.ctx.serial}"
 
         # Configure the Device Info
         self._attr_device_info = self.coordinator.device_info
+
+        # Poll data as of the last coordinator update
+        self._data: IntelliFirePollData = coordinator.read_data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached poll data before writing state."""
+        self._data = self.coordinator.read_data
+        super()._handle_coordinator_update()
@@ -14,7 +14,6 @@ from homeassistant.components.fan import (
     FanEntityDescription,
     FanEntityFeature,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util.percentage import (
@@ -22,12 +21,12 @@ from homeassistant.util.percentage import (
     ranged_value_to_percentage,
 )
 
-from .const import DOMAIN, LOGGER
-from .coordinator import IntellifireDataUpdateCoordinator
+from .const import LOGGER
+from .coordinator import IntellifireConfigEntry, IntellifireDataUpdateCoordinator
 from .entity import IntellifireEntity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntellifireFanRequiredKeysMixin:
     """Required keys for fan entity."""
 
@@ -56,16 +55,18 @@ INTELLIFIRE_FANS: tuple[IntellifireFanEntityDescription, ...] = (
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IntellifireConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the fans."""
-    coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     if coordinator.data.has_fan:
         async_add_entities(
-            IntellifireFan(coordinator=coordinator, description=description)
-            for description in INTELLIFIRE_FANS
+            [
+                IntellifireFan(coordinator=coordinator, description=description)
+                for description in INTELLIFIRE_FANS
+            ]
         )
         return
     LOGGER.debug("Disabling Fan - IntelliFire device does not appear to have one")
@@ -77,33 +78,43 @@ class IntellifireFan(IntellifireEntity, FanEntity):
     entity_description: IntellifireFanEntityDescription
     _attr_supported_features = FanEntityFeature.SET_SPEED | FanEntityFeature.TURN_OFF | FanEntityFeature.TURN_ON
 
+    def __init__(
+        self,
+        coordinator: IntellifireDataUpdateCoordinator,
+        description: IntellifireFanEntityDescription,
+    ) -> None:
+        """Initialize the fan."""
+        super().__init__(coordinator, description)
+
+        self._value_fn = description.value_fn
+        self._set_fn = description.set_fn
+        self._speed_range = description.speed_range
+
     @property
     def is_on(self) -> bool:
         """Return on or off."""
-        return self.entity_description.value_fn(self.coordinator.read_api.data) >= 1
+        return self._value_fn(self._data) >= 1
 
     @property
     def percentage(self) -> int | None:
         """Return fan percentage."""
         return ranged_value_to_percentage(
-            self.entity_description.speed_range,
-            self.coordinator.read_api.data.fanspeed,
+            self._speed_range,
+            self._data.fanspeed,
         )
 
     @property
     def speed_count(self) -> int:
         """Count of supported speeds."""
-        return self.entity_description.speed_range[1]
+        return self._speed_range[1]
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
         # Calculate percentage steps
         LOGGER.debug("Setting Fan Speed %s", percentage)
 
-        int_value = math.ceil(
-            percentage_to_ranged_value(self.entity_description.speed_range, percentage)
-        )
-        await self.entity_description.set_fn(self.coordinator.control_api, int_value)
+        int_value = math.ceil(percentage_to_ranged_value(self._speed_range, percentage))
+        await self._set_fn(self.coordinator.control_api, int_value)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_on(
@@ -115,16 +126,14 @@ class IntellifireFan(IntellifireEntity, FanEntity):
         """Turn on the fan."""
         if percentage:
             int_value = math.ceil(
-                percentage_to_ranged_value(
-                    self.entity_description.speed_range, percentage
-                )
+                percentage_to_ranged_value(self._speed_range, percentage)
             )
         else:
             int_value = 1
-        await self.entity_description.set_fn(self.coordinator.control_api, int_value)
+        await self._set_fn(self.coordinator.control_api, int_value)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the fan."""
-        await self.entity_description.set_fn(self.coordinator.control_api, 0)
+        await self._set_fn(self.coordinator.control_api, 0)
         await self.coordinator.async_request_refresh()
@@ -14,16 +14,15 @@ from homeassistant.components.light import (
     LightEntity,
     LightEntityDescription,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, LOGGER
-from .coordinator import IntellifireDataUpdateCoordinator
+from .const import LOGGER
+from .coordinator import IntellifireConfigEntry, IntellifireDataUpdateCoordinator
 from .entity import IntellifireEntity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntellifireLightRequiredKeysMixin:
     """Required keys for fan entity."""
 
@@ -55,15 +54,26 @@ class IntellifireLight(IntellifireEntity, LightEntity):
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
+    def __init__(
+        self,
+        coordinator: IntellifireDataUpdateCoordinator,
+        description: IntellifireLightEntityDescription,
+    ) -> None:
+        """Initialize the light."""
+        super().__init__(coordinator, description)
+
+        self._value_fn = description.value_fn
+        self._set_fn = description.set_fn
+
     @property
     def brightness(self) -> int:
         """Return the current brightness 0-255."""
-        return 85 * self.entity_description.value_fn(self.coordinator.read_api.data)
+        return 85 * self._value_fn(self._data)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if light is on."""
-        return self.entity_description.value_fn(self.coordinator.read_api.data) >= 1
+        return self._value_fn(self._data) >= 1
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Instruct the light to turn on."""
@@ -72,27 +82,29 @@ class IntellifireLight(IntellifireEntity, LightEntity):
         else:
             light_level = 2
 
-        await self.entity_description.set_fn(self.coordinator.control_api, light_level)
+        await self._set_fn(self.coordinator.control_api, light_level)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the light to turn off."""
-        await self.entity_description.set_fn(self.coordinator.control_api, 0)
+        await self._set_fn(self.coordinator.control_api, 0)
         await self.coordinator.async_request_refresh()
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IntellifireConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the fans."""
-    coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     if coordinator.data.has_light:
         async_add_entities(
-            IntellifireLight(coordinator=coordinator, description=description)
-            for description in INTELLIFIRE_LIGHTS
+            [
+                IntellifireLight(coordinator=coordinator, description=description)
+                for description in INTELLIFIRE_LIGHTS
+            ]
         )
         return
     LOGGER.debug("Disabling Lights - IntelliFire device does not appear to have one")
@@ -8,22 +8,21 @@ from homeassistant.components.number import (
     NumberEntityDescription,
     NumberMode,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, LOGGER
-from .coordinator import IntellifireDataUpdateCoordinator
+from .const import LOGGER
+from .coordinator import IntellifireConfigEntry, IntellifireDataUpdateCoordinator
 from .entity import IntellifireEntity
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IntellifireConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the fans."""
-    coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     description = NumberEntityDescription(
         key="flame_control",
@@ -61,7 +60,7 @@ class IntellifireFlameControlEntity(IntellifireEntity, NumberEntity):
     def native_value(self) -> float | None:
         """Return the current Flame Height segment number value."""
         # UI uses 1-5 for flame height, backing lib uses 0-4
-        value = self.coordinator.read_api.data.flameheight + 1
+        value = self._data.flameheight + 1
         return value
 
     async def async_set_native_value(self, value: float) -> None:
@@ -74,4 +73,4 @@ class IntellifireFlameControlEntity(IntellifireEntity, NumberEntity):
             value_to_send,
         )
         await self.coordinator.control_api.set_flame_height(height=value_to_send)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
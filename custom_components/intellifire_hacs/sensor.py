@@ -4,6 +4,10 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
+import sys
+
+from intellifire4py.const import IntelliFireApiMode
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,18 +15,15 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.dt import utcnow
 
-from .const import DOMAIN
-from .coordinator import IntellifireDataUpdateCoordinator
+from .coordinator import IntellifireConfigEntry, IntellifireDataUpdateCoordinator
 from .entity import IntellifireEntity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntellifireSensorRequiredKeysMixin:
     """Mixin for required keys."""
 
@@ -39,22 +40,66 @@ class IntellifireSensorEntityDescription(
     """Describes a sensor entity."""
 
 
+# Timestamps derived from relative seconds in the poll data
+_DERIVED_TIMESTAMP_KEYS = {"timer_end_timestamp", "downtime", "uptime"}
+
+# Sensor options for each API mode, NONE only occurs while the entry shuts down
+_MODE_NAME: dict[IntelliFireApiMode, str] = {
+    IntelliFireApiMode.LOCAL: "local",
+    IntelliFireApiMode.CLOUD: "cloud",
+}
+
+
 def _time_remaining_to_timestamp(
     coordinator: IntellifireDataUpdateCoordinator,
 ) -> datetime | None:
     """Define a sensor that takes into account timezone."""
-    if not (seconds_offset := coordinator.read_api.data.timeremaining_s):
+    if not (seconds_offset := coordinator.read_data.timeremaining_s):
+        return None
+    # Relative times are anchored to when they were sampled, so they hold steady
+    if (sampled := coordinator.read_api.last_poll_utc) is None:
         return None
-    return utcnow() + timedelta(seconds=seconds_offset)
+    return sampled + timedelta(seconds=seconds_offset)
 
 
 def _downtime_to_timestamp(
     coordinator: IntellifireDataUpdateCoordinator,
 ) -> datetime | None:
     """Define a sensor that takes into account a timezone."""
-    if not (seconds_offset := coordinator.read_api.data.downtime):
+    if not (seconds_offset := coordinator.read_data.downtime):
+        return None
+    if (sampled := coordinator.read_api.last_poll_utc) is None:
+        return None
+    return sampled - timedelta(seconds=seconds_offset)
+
+
+def _flame_height(coordinator: IntellifireDataUpdateCoordinator) -> int:
+    """Return the flame height - UI uses 1-5 for flame height, backing lib uses 0-4."""
+    return coordinator.read_data.flameheight + 1
+
+
+def _uptime_to_timestamp(
+    coordinator: IntellifireDataUpdateCoordinator,
+) -> datetime | None:
+    """Return the boot time, computed from the uptime."""
+    if (sampled := coordinator.read_api.last_poll_utc) is None:
         return None
-    return utcnow() - timedelta(seconds=seconds_offset)
+    return sampled - timedelta(seconds=coordinator.read_data.uptime)
+
+
+def _ipv4_address(coordinator: IntellifireDataUpdateCoordinator) -> str:
+    """Return the IP address, interned so repeat polls hand back the same string."""
+    return sys.intern(coordinator.read_data.ipv4_address)
+
+
+def _read_mode_name(coordinator: IntellifireDataUpdateCoordinator) -> str | None:
+    """Return the read mode as a sensor option."""
+    return _MODE_NAME.get(coordinator.get_read_mode())
+
+
+def _control_mode_name(coordinator: IntellifireDataUpdateCoordinator) -> str | None:
+    """Return the control mode as a sensor option."""
+    return _MODE_NAME.get(coordinator.get_control_mode())
 
 
 INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
@@ -63,15 +108,14 @@ INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
         translation_key="flame_height",
         icon="mdi:fire-circle",
         state_class=SensorStateClass.MEASUREMENT,
-        # UI uses 1-5 for flame height, backing lib uses 0-4
-        value_fn=lambda coordinator: (coordinator.read_api.data.flameheight + 1),
+        value_fn=_flame_height,
     ),
     IntellifireSensorEntityDescription(
         key="temperature",
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda coordinator: coordinator.read_api.data.temperature_c,
+        value_fn=attrgetter("read_data.temperature_c"),
     ),
     IntellifireSensorEntityDescription(
         key="target_temp",
@@ -79,14 +123,14 @@ INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda coordinator: coordinator.read_api.data.thermostat_setpoint_c,
+        value_fn=attrgetter("read_data.thermostat_setpoint_c"),
     ),
     IntellifireSensorEntityDescription(
         key="fan_speed",
         translation_key="fan_speed",
         icon="mdi:fan",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda coordinator: coordinator.read_api.data.fanspeed,
+        value_fn=attrgetter("read_data.fanspeed"),
     ),
     IntellifireSensorEntityDescription(
         key="timer_end_timestamp",
@@ -108,28 +152,27 @@ INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
         translation_key="uptime",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda coordinator: utcnow()
-        - timedelta(seconds=coordinator.read_api.data.uptime),
+        value_fn=_uptime_to_timestamp,
     ),
     IntellifireSensorEntityDescription(
         key="connection_quality",
         translation_key="connection_quality",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.read_api.data.connection_quality,
+        value_fn=attrgetter("read_data.connection_quality"),
         entity_registry_enabled_default=False,
     ),
     IntellifireSensorEntityDescription(
         key="ecm_latency",
         translation_key="ecm_latency",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.read_api.data.ecm_latency,
+        value_fn=attrgetter("read_data.ecm_latency"),
         entity_registry_enabled_default=False,
     ),
     IntellifireSensorEntityDescription(
         key="ipv4_address",
         translation_key="ipv4_address",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.read_api.data.ipv4_address,
+        value_fn=_ipv4_address,
     ),
     IntellifireSensorEntityDescription(
         key="control_mode",
@@ -137,7 +180,7 @@ INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.ENUM,
         options=["local", "cloud"],
-        value_fn=lambda coordinator: coordinator.get_read_mode().name.lower(),
+        value_fn=_control_mode_name,
     ),
     IntellifireSensorEntityDescription(
         key="read_mode",
@@ -145,7 +188,7 @@ INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
         options=["local", "cloud"],
-        value_fn=lambda coordinator: coordinator.get_control_mode().name.lower(),
+        value_fn=_read_mode_name,
     ),
 
     # HACS DIAGNOSTIC SENSORS
@@ -153,28 +196,28 @@ INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
         key="local_connectivity",
         name="local_connectivity",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.fireplace.local_connectivity
+        value_fn=attrgetter("fireplace.local_connectivity"),
     ),
 
     IntellifireSensorEntityDescription(
         key="cloud_connectivity",
         name="cloud_connectivity",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.fireplace.cloud_connectivity,
+        value_fn=attrgetter("fireplace.cloud_connectivity"),
     ),
 
     IntellifireSensorEntityDescription(
         key="local_polling",
         name="local_polling",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.fireplace.is_local_polling
+        value_fn=attrgetter("fireplace.is_local_polling"),
     ),
 
     IntellifireSensorEntityDescription(
         key="cloud_polling",
         name="cloud_polling",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.fireplace.is_cloud_polling,
+        value_fn=attrgetter("fireplace.is_cloud_polling"),
     ),
 
     # Diagnostic sensors of sorts
@@ -183,21 +226,25 @@ INTELLIFIRE_SENSORS: tuple[IntellifireSensorEntityDescription, ...] = (
         name="last_poll",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda coordinator: coordinator.read_api.last_poll_utc
+        value_fn=attrgetter("read_api.last_poll_utc"),
     ),
 
 )
 
 
 async def async_setup_entry(
-    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+    hass: HomeAssistant,
+    entry: IntellifireConfigEntry,
+    async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Define setup entry call."""
 
-    coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     async_add_entities(
-        IntellifireSensor(coordinator=coordinator, description=description)
-        for description in INTELLIFIRE_SENSORS
+        [
+            IntellifireSensor(coordinator=coordinator, description=description)
+            for description in INTELLIFIRE_SENSORS
+        ]
     )
 
 
@@ -206,7 +253,30 @@ class IntellifireSensor(IntellifireEntity, SensorEntity):
 
     entity_description: IntellifireSensorEntityDescription
 
+    def __init__(
+        self,
+        coordinator: IntellifireDataUpdateCoordinator,
+        description: IntellifireSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description)
+
+        self._value_fn = description.value_fn
+        self._derived_timestamp = description.key in _DERIVED_TIMESTAMP_KEYS
+        self._timestamp_refresh_time: datetime | None = None
+        self._timestamp_value: datetime | None = None
+
     @property
     def native_value(self) -> int | str | datetime | float | None:
         """Return the state."""
-        return self.entity_description.value_fn(self.coordinator)
+        if not self._derived_timestamp:
+            return self._value_fn(self.coordinator)
+
+        # Derived timestamps only change when the coordinator refreshes
+        refresh_time = self.coordinator.refresh_time
+        if refresh_time is self._timestamp_refresh_time:
+            return self._timestamp_value
+        self._timestamp_refresh_time = refresh_time
+
+        self._timestamp_value = self._value_fn(self.coordinator)
+        return self._timestamp_value
@@ -3,19 +3,25 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.dt import utcnow
 
-from . import IntellifireDataUpdateCoordinator
-from .const import DOMAIN
+from .coordinator import IntellifireConfigEntry, IntellifireDataUpdateCoordinator
 from .entity import IntellifireEntity
 
+# Longest a commanded state is reported without a poll confirming it, covers a
+# full cloud long poll
+OPTIMISTIC_STATE_TIMEOUT = 90  # seconds
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class IntellifireSwitchRequiredKeysMixin:
     """Mixin for required keys."""
 
@@ -31,37 +37,59 @@ class IntellifireSwitchEntityDescription(
     """Describes a switch entity."""
 
 
+def _flame_on(coordinator: IntellifireDataUpdateCoordinator) -> Awaitable:
+    """Turn the flame on."""
+    return coordinator.control_api.flame_on()
+
+
+def _flame_off(coordinator: IntellifireDataUpdateCoordinator) -> Awaitable:
+    """Turn the flame off."""
+    return coordinator.control_api.flame_off()
+
+
+def _pilot_on(coordinator: IntellifireDataUpdateCoordinator) -> Awaitable:
+    """Turn the pilot light on."""
+    return coordinator.control_api.pilot_on()
+
+
+def _pilot_off(coordinator: IntellifireDataUpdateCoordinator) -> Awaitable:
+    """Turn the pilot light off."""
+    return coordinator.control_api.pilot_off()
+
+
 INTELLIFIRE_SWITCHES: tuple[IntellifireSwitchEntityDescription, ...] = (
     IntellifireSwitchEntityDescription(
         key="on_off",
         translation_key="flame",
         icon="mdi:fire",
-        on_fn=lambda coordinator: coordinator.control_api.flame_on(),
-        off_fn=lambda coordinator: coordinator.control_api.flame_off(),
-        value_fn=lambda coordinator: coordinator.read_api.data.is_on,
+        on_fn=_flame_on,
+        off_fn=_flame_off,
+        value_fn=attrgetter("read_data.is_on"),
     ),
     IntellifireSwitchEntityDescription(
         key="pilot",
         translation_key="pilot_light",
         icon="mdi:fire-alert",
-        on_fn=lambda coordinator: coordinator.control_api.pilot_on(),
-        off_fn=lambda coordinator: coordinator.control_api.pilot_off(),
-        value_fn=lambda coordinator: coordinator.read_api.data.pilot_on,
+        on_fn=_pilot_on,
+        off_fn=_pilot_off,
+        value_fn=attrgetter("read_data.pilot_on"),
     ),
 )
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: IntellifireConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Configure switch entities."""
-    coordinator: IntellifireDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     async_add_entities(
-        IntellifireSwitch(coordinator=coordinator, description=description)
-        for description in INTELLIFIRE_SWITCHES
+        [
+            IntellifireSwitch(coordinator=coordinator, description=description)
+            for description in INTELLIFIRE_SWITCHES
+        ]
     )
 
 
@@ -70,17 +98,84 @@ class IntellifireSwitch(IntellifireEntity, SwitchEntity):
 
     entity_description: IntellifireSwitchEntityDescription
 
+    # State reported after a command, until a poll taken after it comes in
+    _optimistic_is_on: bool | None = None
+    _optimistic_since: datetime | None = None
+    _cancel_optimistic_expiry: CALLBACK_TYPE | None = None
+
+    def __init__(
+        self,
+        coordinator: IntellifireDataUpdateCoordinator,
+        description: IntellifireSwitchEntityDescription,
+    ) -> None:
+        """Initialize the switch."""
+        super().__init__(coordinator, description)
+
+        self._on_fn = description.on_fn
+        self._off_fn = description.off_fn
+        self._value_fn = description.value_fn
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        await self.entity_description.on_fn(self.coordinator)
-        await self.async_update_ha_state(force_refresh=True)
+        await self._on_fn(self.coordinator)
+        self._async_set_optimistic_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
-        await self.entity_description.off_fn(self.coordinator)
-        await self.async_update_ha_state(force_refresh=True)
+        await self._off_fn(self.coordinator)
+        self._async_set_optimistic_state(False)
+
+    @callback
+    def _async_set_optimistic_state(self, is_on: bool) -> None:
+        """Report the commanded state now and refresh in the background.
+
+        A command updates the controlling API's own poll data, so the state is
+        only assumed when reads come from the other API.
+        """
+        coordinator = self.coordinator
+        if coordinator.get_read_mode() != coordinator.get_control_mode():
+            self._async_clear_optimistic_state()
+            self._optimistic_is_on = is_on
+            self._optimistic_since = utcnow()
+            self._cancel_optimistic_expiry = async_call_later(
+                self.hass, OPTIMISTIC_STATE_TIMEOUT, self._async_expire_optimistic_state
+            )
+        self.async_write_ha_state()
+        self.hass.async_create_task(coordinator.async_request_refresh())
+
+    @callback
+    def _async_clear_optimistic_state(self) -> None:
+        """Go back to reporting the polled state."""
+        if self._cancel_optimistic_expiry is not None:
+            self._cancel_optimistic_expiry()
+            self._cancel_optimistic_expiry = None
+        self._optimistic_is_on = None
+        self._optimistic_since = None
+
+    @callback
+    def _async_expire_optimistic_state(self, _now: datetime) -> None:
+        """Stop assuming the commanded state when no poll has confirmed it."""
+        self._cancel_optimistic_expiry = None
+        self._async_clear_optimistic_state()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the optimistic state once the fireplace has been polled since."""
+        if self._optimistic_since is not None:
+            last_poll = self.coordinator.read_api.last_poll_utc
+            if last_poll is not None and last_poll > self._optimistic_since:
+                self._async_clear_optimistic_state()
+        super()._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending optimistic state expiry."""
+        self._async_clear_optimistic_state()
+        await super().async_will_remove_from_hass()
 
     @property
     def is_on(self) -> bool | None:
         """Return the on state."""
-        return self.entity_description.value_fn(self.coordinator)
+        if self._optimistic_is_on is not None:
+            return self._optimistic_is_on
+        return self._value_fn(self.coordinator)